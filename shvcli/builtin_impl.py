@@ -8,24 +8,28 @@ from prompt_toolkit.completion import Completion
 
 from .builtin import METHODS, Argument, XMethod, builtin, xbuiltin
 from .client import Node, SHVClient
-from .complet_tools import comp_from, comp_path
+from .complet_tools import comp_from, comp_from_sorted, comp_path
 from .config import CliConfig
 from .lsdir import ls_node_format
 from .parse import CliItems
 from .scan import scan_nodes
 from .tools import lookahead, print_block, print_flist, print_ftext, print_row
 
+_BOOLS = {"true": True, "t": True, "false": False, "f": False}
+"""Values accepted for boolean options by ``!set``."""
+
 
 def argument_signal_comp(
     shvclient: SHVClient, config: CliConfig, items: CliItems
 ) -> collections.abc.Iterable[Completion]:
     """Completion for subscribe argument."""
     if ":" in items.param_raw:
-        path, method, signal = items.interpret_param_ri(config)[-1].split(":")
+        path, _, method = items.interpret_param_ri(config)[-1].partition(":")
+        method, _, signal = method.partition(":")
         node = shvclient.tree.get_path(path)
         if node is not None:
             if items.param_raw.rsplit(maxsplit=1)[-1].count(":") == 1:
-                yield from comp_from(method, node.methods)
+                yield from comp_from_sorted(method, shvclient.method_names(node))
             elif method in node.methods:
                 yield from comp_from(signal, node.methods[method])
     else:
@@ -110,7 +114,7 @@ def tree(shvclient: SHVClient, config: CliConfig, items: CliItems) -> None:
     """Print tree of nodes discovered in this session."""
 
     def print_node(node: Node, cols: list[bool]) -> None:
-        for name, hasnext in lookahead(node):
+        for name, hasnext in lookahead(node.nodes):
             print_ftext(
                 itertools.chain(
                     (("", "│ " if c else "  ") for c in cols),
@@ -120,7 +124,7 @@ def tree(shvclient: SHVClient, config: CliConfig, items: CliItems) -> None:
                     ]),
                 )
             )
-            print_node(node[name], [*cols, hasnext])
+            print_node(node.nodes[name], [*cols, hasnext])
 
     path = items.interpret_param_path(config)
     if (node := shvclient.tree.get_path(path)) is not None:
@@ -147,7 +151,7 @@ async def scan(
 def _set(client: SHVClient, config: CliConfig, items: CliItems) -> None:
     """Set configuration options in runtime."""
     if not items.param_raw.strip():
-        w = max(len(n) for n in config.OPTS.keys())
+        w = max(map(len, config.OPTS))
         for n, t in config.OPTS.items():
             row = [("", (" " * (w - len(n))) + n + "  ")]
             match t:
@@ -171,11 +175,10 @@ def _set(client: SHVClient, config: CliConfig, items: CliItems) -> None:
             value: bool | int | float
             match config.OPTS[opt]:
                 case config.Type.BOOL:
-                    bools = {"true": True, "t": True, "false": False, "f": False}
-                    if val not in bools:
+                    if (bval := _BOOLS.get(val)) is None:
                         print(f"Invalid value, expected 'true' or 'false': {val}")
                         return
-                    value = bools[val]
+                    value = bval
                 case config.Type.INT:
                     value = int(val, 0)
                 case config.Type.FLOAT:
@@ -36,24 +36,24 @@ async def _app(config: CliConfig, shvclient: SHVClient) -> None:
         completer=CliCompleter(shvclient, config),
         validator=CliValidator(shvclient, config),
     )
-    while True:
-        try:
-            prompt_path = (
-                "ansibrightred"
-                if shvclient.tree.get_path(config.path) is None
-                else "ansibrightblue",
-                config.shvpath(),
-            )
+    with patch_stdout():
+        while True:
             try:
-                with patch_stdout():
+                prompt_path = (
+                    "ansibrightred"
+                    if shvclient.tree.get_path(config.shvpath()) is None
+                    else "ansibrightblue",
+                    config.shvpath(),
+                )
+                try:
                     result = await session.prompt_async(
                         [prompt_path, ("", "> ")], vi_mode=config.vimode
                     )
-            except EOFError:
-                return
-            await handle_line(shvclient, config, result)
-        except KeyboardInterrupt:
-            continue
+                except EOFError:
+                    return
+                await handle_line(shvclient, config, result)
+            except KeyboardInterrupt:
+                continue
 
 
 async def run(config: CliConfig, subscriptions: list[str]) -> None:
@@ -72,10 +72,14 @@ async def run(config: CliConfig, subscriptions: list[str]) -> None:
         )
         cpath = xdg.BaseDirectory.save_cache_path("shvcli")
         fname = re.sub(r"[^\w_. -]", "_", cacheurl.to_url())
-        cachepath = pathlib.Path(cpath).expanduser() / fname
-        if cachepath.exists():
-            with cachepath.open("r") as f:
-                shvclient.tree = Node.load(json.load(f))
+        # Older versions can't load the current format and thus the suffix
+        cachepath = pathlib.Path(cpath).expanduser() / f"{fname}.v2"
+        for path in (cachepath, cachepath.with_name(fname)):
+            if path.exists():
+                # Cache is only an optimization and thus unusable one is ignored
+                with contextlib.suppress(Exception), path.open("r") as f:
+                    shvclient.tree = Node.load(json.load(f))
+                break
     if config.initial_scan:
         await scan_nodes(shvclient, "", config.initial_scan_depth)
 
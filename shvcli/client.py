@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import collections.abc
+import sys
 import typing
 from pathlib import PurePosixPath
 
@@ -19,85 +21,119 @@ from shv import (
 from . import VERSION
 from .tools import print_cpon
 
+_NOT_CALLABLE = int(RpcMethodFlags.NOT_CALLABLE)
 
-class Node(collections.abc.Mapping[str, "Node"]):
+_SIGNALS: dict[frozenset[str], frozenset[str]] = {}
+
+
+def _signals(signals: collections.abc.Iterable[str]) -> frozenset[str]:
+    """Get frozen set of signals that is shared with other equal sets.
+
+    Most of the methods have the same signals (commonly none) and thus sharing
+    them saves memory for large trees.
+    """
+    res = frozenset(signals)
+    return _SIGNALS.setdefault(res, res)
+
+
+_NO_SIGNALS = _signals(())
+"""Shared signals of methods without any signal."""
+
+_LS_SIGNALS = _signals(("lsmod",))
+"""Shared signals of the ls method."""
+
+
+def _split_path(path: str | PurePosixPath) -> list[str]:
+    """Split path to the node names while ignoring empty and '.' ones."""
+    return [n for n in str(path).split("/") if n and n != "."]
+
+
+class Node:
     """Abstraction on the tree node."""
 
+    __slots__ = ("methods", "methods_probed", "nodes", "nodes_probed")
+
     def __init__(self) -> None:
         """Initialize the node."""
         self.nodes: dict[str, Node] = {}
-        self.methods: dict[str, set[str]] = {"ls": {"lsmod"}, "dir": set()}
+        self.methods: dict[str, frozenset[str]] = {
+            "ls": _LS_SIGNALS,
+            "dir": _NO_SIGNALS,
+        }
         self.nodes_probed = False
         self.methods_probed = False
 
-    def __getitem__(self, key: str) -> Node:
-        """Get node from nodes."""
-        return self.nodes[key]
-
-    def __iter__(self) -> typing.Iterator[str]:
-        """Iterate over child nodes."""
-        return iter(self.nodes)
-
-    def __len__(self) -> int:
-        """Get number of child nodes."""
-        return len(self.nodes)
-
     def valid_path(self, path: str | PurePosixPath) -> Node:
         """Add valid path relative to this node."""
-        if isinstance(path, str):
-            path = PurePosixPath(path)
         node = self
-        for n in path.parts:
-            if n not in node:
-                node.nodes[n] = Node()
-            node = node[n]
+        for n in _split_path(path):
+            child = node.nodes.get(n)
+            if child is None:
+                child = node.nodes[sys.intern(n)] = Node()
+            node = child
         return node
 
     def invalid_path(self, path: str | PurePosixPath) -> None:
         """Invalidate path as not existent."""
-        if isinstance(path, str):
-            path = PurePosixPath(path)
+        parts = _split_path(path)
         pnode = None
         node = self
-        for n in path.parts:
-            if n not in node:
+        for n in parts:
+            child = node.nodes.get(n)
+            if child is None:
                 return
             pnode = node
-            node = node[n]
+            node = child
         if pnode is not None:
-            pnode.nodes.pop(path.name)
+            pnode.nodes.pop(parts[-1])
 
     def get_path(self, path: str | PurePosixPath) -> None | Node:
         """Get node on given path."""
-        if isinstance(path, str):
-            path = PurePosixPath(path)
         node = self
-        for n in path.parts[1 if path.is_absolute() else 0 :]:
-            if n not in node:
+        for n in _split_path(path):
+            child = node.nodes.get(n)
+            if child is None:
                 return None
-            node = node[n]
+            node = child
         return node
 
-    def dump(self) -> dict[str, object]:
-        """Dump the data to basic types."""
-        return {
-            "nodes": {n: v.dump() for n, v in self.nodes.items()},
-            "methods": {n: list(v) for n, v in self.methods.items()},
-            "nodes_probed": self.nodes_probed,
-            "methods_probed": self.methods_probed,
-        }
+    def dump(self) -> tuple[object, ...]:
+        """Dump the data to basic types.
+
+        Positional layout is used to not repeat keys for every node.
+        """
+        return (
+            {n: v.dump() for n, v in self.nodes.items()},
+            {n: list(v) for n, v in self.methods.items()},
+            self.nodes_probed,
+            self.methods_probed,
+        )
 
     @classmethod
-    def load(cls, data: collections.abc.Mapping[str, object]) -> Node:
-        """Load node tree from dump."""
-        assert isinstance(data, collections.abc.Mapping)
+    def load(
+        cls,
+        data: collections.abc.Sequence[object] | collections.abc.Mapping[str, object],
+    ) -> Node:
+        """Load node tree from dump.
+
+        The mapping based dump produced by older versions is supported as well.
+        """
+        if isinstance(data, collections.abc.Mapping):
+            data = (
+                data["nodes"],
+                data["methods"],
+                data["nodes_probed"],
+                data["methods_probed"],
+            )
+        assert isinstance(data, collections.abc.Sequence)
+        nodes, methods, nodes_probed, methods_probed = data
         res = cls()
-        if isinstance(data["nodes"], collections.abc.Mapping):
-            res.nodes = {n: cls.load(v) for n, v in data["nodes"].items()}
-        if isinstance(data["methods"], collections.abc.Mapping):
-            res.methods = {str(n): set(v) for n, v in data["methods"].items()}
-        res.nodes_probed = bool(data["nodes_probed"])
-        res.methods_probed = bool(data["methods_probed"])
+        if isinstance(nodes, collections.abc.Mapping):
+            res.nodes = {sys.intern(n): cls.load(v) for n, v in nodes.items()}
+        if isinstance(methods, collections.abc.Mapping):
+            res.methods = {sys.intern(str(n)): _signals(v) for n, v in methods.items()}
+        res.nodes_probed = bool(nodes_probed)
+        res.methods_probed = bool(methods_probed)
         return res
 
 
@@ -111,6 +147,8 @@ class SHVClient(SimpleClient):
         """Initialize client and set create reference to tree."""
         self.tree = Node()
         self.tree.valid_path(".app")
+        self._probes: dict[str, asyncio.Task[Node | None]] = {}
+        self._names: dict[tuple[int, bool], tuple[Node, tuple[str, ...]]] = {}
         super().__init__(*args, **kwargs)
 
     async def _loop(self) -> None:
@@ -120,9 +158,14 @@ class SHVClient(SimpleClient):
     async def _message(self, msg: RpcMessage) -> None:
         await super()._message(msg)
         if msg.is_signal:
-            self.tree.valid_path(msg.path or "").methods.setdefault(
-                msg.source, set()
-            ).add(msg.signal_name)
+            node = self.tree.get_path(msg.path or "")
+            if node is None:
+                node = self.tree.valid_path(msg.path or "")
+                self._names.clear()
+            signals = node.methods.get(msg.source, _NO_SIGNALS)
+            if msg.signal_name not in signals:
+                node.methods[msg.source] = _signals((*signals, msg.signal_name))
+                self._names.clear()
             print_cpon(msg.param, f"{msg.path}:{msg.source}:{msg.signal_name}: ", True)
 
     async def ls(self, path: str) -> list[str]:
@@ -132,10 +175,13 @@ class SHVClient(SimpleClient):
             res = await super().ls(path)
         except RpcError as exc:
             self.tree.invalid_path(path)
+            self._names.clear()
             raise exc
 
+        self._names.clear()
         node = self.tree.valid_path(path)
-        node.nodes = {k: node[k] if k in node else Node() for k in res}
+        if list(node.nodes) != res:
+            node.nodes = {sys.intern(k): node.nodes.get(k) or Node() for k in res}
         node.nodes_probed = True
 
         return res
@@ -147,12 +193,14 @@ class SHVClient(SimpleClient):
             res = await super().dir(path, details)
         except RpcError as exc:
             self.tree.invalid_path(path)
+            self._names.clear()
             raise exc
+        self._names.clear()
         node = self.tree.valid_path(path)
         node.methods = {
-            d.name: set(d.signals)
+            sys.intern(d.name): _signals(sys.intern(s) for s in d.signals)
             for d in res
-            if RpcMethodFlags.NOT_CALLABLE not in d.flags
+            if not int(d.flags) & _NOT_CALLABLE
         }
         node.methods_probed = True
         return res
@@ -174,36 +222,71 @@ class SHVClient(SimpleClient):
         except RpcMethodNotFoundError as exc:
             raise exc
         except RpcError as exc:
-            self.tree.valid_path(path).methods.setdefault(method, set())
+            self.tree.valid_path(path).methods.setdefault(method, _NO_SIGNALS)
+            self._names.clear()
             raise exc
-        self.tree.valid_path(path).methods.setdefault(method, set())
+        self.tree.valid_path(path).methods.setdefault(method, _NO_SIGNALS)
+        self._names.clear()
         return res
 
+    def node_names(self, node: Node) -> tuple[str, ...]:
+        """Get sorted names of child nodes of the given node.
+
+        The result is cached until the tree is modified by this client.
+        """
+        return self._sorted_names(node, False)
+
+    def method_names(self, node: Node) -> tuple[str, ...]:
+        """Get sorted names of methods of the given node.
+
+        The result is cached until the tree is modified by this client.
+        """
+        return self._sorted_names(node, True)
+
+    def _sorted_names(self, node: Node, methods: bool) -> tuple[str, ...]:
+        key = (id(node), methods)
+        cached = self._names.get(key)
+        if cached is None or cached[0] is not node:
+            cached = (node, tuple(sorted(node.methods if methods else node.nodes)))
+            self._names[key] = cached
+        return cached[1]
+
     async def probe(self, path: str) -> Node | None:
-        """Probe operation, that is discover methods and children of the node."""
+        """Probe operation, that is discover methods and children of the node.
+
+        The required ``ls`` and ``dir`` requests are sent together so probe costs
+        only a single round trip. Concurrent probes of the same path share a
+        single probe operation.
+        """
+        node = self.tree.get_path(path)
+        if node is not None and node.nodes_probed and node.methods_probed:
+            return node
+        task = self._probes.get(path)
+        if task is None:
+            task = asyncio.create_task(self._probe(path, node))
+            self._probes[path] = task
+            task.add_done_callback(lambda _: self._probes.pop(path, None))
+        return await asyncio.shield(task)
+
+    async def _probe(self, path: str, node: Node | None) -> Node | None:
+        calls: list[typing.Awaitable[object]] = []
+        if node is None or not node.nodes_probed:
+            calls.append(self.ls(path))
+        if node is None or not node.methods_probed:
+            calls.append(self.dir(path))
         try:
-            node = self.tree.get_path(path)
-            if node is None:
-                await self.ls(path)
-            node = self.tree.get_path(path)
-            assert node is not None
-            if not node.methods_probed:
-                await self.dir(path)
-            if not node.nodes_probed:
-                await self.ls(path)
+            await asyncio.gather(*calls)
         except (RpcError, ValueError):
-            pass
-        return node
+            return self.tree.get_path(path)
+        # The existing node is only updated by ls and dir and thus still valid
+        return self.tree.get_path(path) if node is None else node
 
     async def path_is_valid(self, path: str) -> bool:
         """Check if given path is valid by using ls command."""
         path = path.strip("/")
         if not path:
             return True  # top level is always valid
-        if "/" in path:
-            pth, name = path.rsplit("/", maxsplit=1)
-        else:
-            pth, name = "", path
+        pth, _, name = path.rpartition("/")
         try:
             return name in await self.ls(pth)
         except RpcError:
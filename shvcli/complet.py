@@ -1,37 +1,49 @@
 """Completion for CLI."""
 
+import asyncio
 import collections.abc
+import time
 import typing
 
+from prompt_toolkit.application import get_app
 from prompt_toolkit.completion import CompleteEvent, Completer, Completion
 from prompt_toolkit.document import Document
 
 from . import builtin
 from .client import SHVClient
-from .complet_tools import comp_from, comp_path, comp_path_identify
+from .complet_tools import comp_from_sorted, comp_path, comp_path_identify
 from .config import CliConfig
-from .parse import CliFlags, parse_line
+from .parse import CliFlags, parse_line_cached
 
 
 class CliCompleter(Completer):
     """Completer for SHVCLI based on discovered tree."""
 
+    PROBE_TTL: float = 2.0
+    """Seconds for which the same path is not probed again on completion."""
+    PROBE_DELAY: float = 0.05
+    """Seconds of no input before path is probed on completion."""
+
     def __init__(self, shvclient: SHVClient, config: CliConfig) -> None:
         """Initialize completer and get references to client and config."""
         self.shvclient = shvclient
         self.config = config
+        self._builtins = tuple(sorted(f"!{n}" for n in builtin.METHODS))
+        self._probed: dict[str, float] = {}
 
     def get_completions(
         self, document: Document, complete_event: CompleteEvent
     ) -> collections.abc.Iterable[Completion]:
         """Implement completions."""
-        items = parse_line(document.text)
+        items = parse_line_cached(document.text)
 
         # Parameters
         if CliFlags.COMPLETE_CALL in items.flags:
             if items.method in {"ls", "dir"} and not self.config.raw:
                 yield from comp_path(self.shvclient, self.config, items)
-            elif bmethod := builtin.get_builtin(items.method[1:]):
+            elif items.method.startswith("!") and (
+                bmethod := builtin.get_builtin(items.method[1:])
+            ):
                 if bmethod.argument:
                     yield from bmethod.argument.completion(
                         self.shvclient, self.config, items
@@ -46,17 +58,17 @@ class CliCompleter(Completer):
 
         # Methods
         node = self.shvclient.tree.get_path(self.config.shvpath(items.path))
-        yield from comp_from(
+        yield from comp_from_sorted(
             items.method,
-            ["ls", "dir"] if node is None else node.methods,
-            (f"!{n}" for n in builtin.METHODS),
+            ("dir", "ls") if node is None else self.shvclient.method_names(node),
         )
+        yield from comp_from_sorted(items.method, self._builtins)
 
     async def get_completions_async(
         self, document: Document, complete_event: CompleteEvent
     ) -> typing.AsyncGenerator[Completion, None]:
         """Completions as async generator."""
-        items = parse_line(document.text)
+        items = parse_line_cached(document.text)
         if self.config.autoprobe and (
             CliFlags.COMPLETE_CALL not in items.flags
             or items.method in {"ls", "dir"}
@@ -69,10 +81,31 @@ class CliCompleter(Completer):
             )
         ):
             if CliFlags.HAS_COLON in items.flags:
-                await self.shvclient.probe(self.config.shvpath(items.path))
+                path = self.config.shvpath(items.path)
             else:
                 pth, _ = comp_path_identify(self.config, items)
-                await self.shvclient.probe(str(pth)[1:])
+                path = str(pth)[1:]
+            if self._probe_needed(path):
+                await asyncio.sleep(self.PROBE_DELAY)
+                if get_app().current_buffer.text != document.text:
+                    return  # Superseded by newer input that is completed instead
+                await self.shvclient.probe(path)
+                self._probed[path] = time.monotonic()
 
         async for res in super().get_completions_async(document, complete_event):
             yield res
+
+    def _probe_needed(self, path: str) -> bool:
+        """Check if path should be probed.
+
+        Probe of already discovered node is not needed and invalid paths and nodes
+        that failed to be probed are not probed again for :attr:`PROBE_TTL`.
+        """
+        node = self.shvclient.tree.get_path(path)
+        if node is not None and node.nodes_probed and node.methods_probed:
+            return False
+        now = time.monotonic()
+        self._probed = {
+            p: t for p, t in self._probed.items() if now - t < self.PROBE_TTL
+        }
+        return path not in self._probed
@@ -1,6 +1,8 @@
 """Tool for completion algorithms."""
 
+import bisect
 import collections.abc
+import functools
 import pathlib
 
 from prompt_toolkit.completion import Completion
@@ -29,6 +31,30 @@ def comp_from(
     )
 
 
+def comp_from_sorted(
+    word: str, values: tuple[str, ...]
+) -> collections.abc.Iterable[Completion]:
+    """Completion helper same as :func:`comp_from` but for sorted values.
+
+    Values with the prefix word are located with bisection and thus not all
+    values have to be checked.
+    """
+    if not word:
+        yield from _comp_all(values)
+        return
+    lo = bisect.bisect_left(values, word)
+    # The first string that is greater than all strings with word as a prefix
+    hi = bisect.bisect_left(values, word[:-1] + chr(ord(word[-1]) + 1), lo)
+    start = -len(word)
+    yield from (Completion(value, start_position=start) for value in values[lo:hi])
+
+
+@functools.lru_cache(maxsize=32)
+def _comp_all(values: tuple[str, ...]) -> tuple[Completion, ...]:
+    """Completions for all values reused while there is no word to complete."""
+    return tuple(Completion(value) for value in values)
+
+
 def comp_path_identify(
     config: CliConfig, items: CliItems
 ) -> tuple[pathlib.PurePosixPath, str]:
@@ -42,10 +68,10 @@ def comp_path_identify(
     else:
         dynpath = items.method
         basepath = config.path
-    onpath = dynpath.rsplit("/", maxsplit=1)
-    if len(onpath) == 1:
-        return basepath, onpath[0]
-    return basepath / onpath[0], onpath[1]
+    head, sep, tail = dynpath.rpartition("/")
+    if not sep:
+        return basepath, tail
+    return basepath / head, tail
 
 
 def comp_path(
@@ -55,10 +81,11 @@ def comp_path(
     pth, comp = comp_path_identify(config, items)
     node = shvclient.tree.get_path(pth)
     if node is not None:
-        if comp in node:
+        if comp in node.nodes:
             yield Completion(f"{comp}:", start_position=-len(comp))
             yield from (
-                Completion(f"{comp}/{n}", start_position=-len(comp)) for n in node[comp]
+                Completion(f"{comp}/{n}", start_position=-len(comp))
+                for n in shvclient.node_names(node.nodes[comp])
             )
         else:
-            yield from comp_from(comp, node)
+            yield from comp_from_sorted(comp, shvclient.node_names(node))
@@ -6,12 +6,47 @@ import enum
 import functools
 import itertools
 import logging
+import os
 import pathlib
+import posixpath
 import subprocess
+import types
 import typing
 
 from shv import RpcUrl
 
+_parse_rpcurl = functools.lru_cache(maxsize=64)(RpcUrl.parse)
+"""Parse RPC URL while reusing result for the same string.
+
+The returned object is shared and thus must not be modified.
+"""
+
+_CONFIG_FILES: tuple[str, ...] = (
+    "/etc/shvcli.ini",
+    str(pathlib.Path.home() / ".shvcli.ini"),
+)
+"""Configuration files in order they are loaded."""
+
+_CONFIGS: dict[tuple[tuple[str, int], ...], configparser.ConfigParser] = {}
+
+
+def _read_config(
+    paths: collections.abc.Iterable[str | pathlib.Path],
+) -> configparser.ConfigParser:
+    """Read configuration files while reusing parsed result of unchanged files."""
+    key: list[tuple[str, int]] = []
+    for path in paths:
+        try:
+            key.append((str(path), os.stat(path).st_mtime_ns))
+        except OSError:
+            pass
+    tkey = tuple(key)
+    if (res := _CONFIGS.get(tkey)) is None:
+        res = configparser.ConfigParser()
+        res.read([p for p, _ in tkey])
+        _CONFIGS[tkey] = res
+    return res
+
 
 class CliConfig:
     """Configuration passed around in CLI implementation."""
@@ -23,7 +58,7 @@ class CliConfig:
         INT = enum.auto()
         FLOAT = enum.auto()
 
-    OPTS: collections.abc.Mapping[str, Type] = {
+    OPTS: collections.abc.Mapping[str, Type] = types.MappingProxyType({
         "vimode": Type.BOOL,
         "autoget": Type.BOOL,
         "autoprobe": Type.BOOL,
@@ -32,27 +67,32 @@ class CliConfig:
         "call_attempts": Type.INT,
         "call_timeout": Type.FLOAT,
         "autoget_timeout": Type.FLOAT,
-    }
+    })
     """Options allowed to be set in runtime and from configuration file.
 
     You can use :func:`setattr` and :func:`getattr`.
     """
 
-    COPTS: collections.abc.Mapping[str, Type] = {
+    COPTS: collections.abc.Mapping[str, Type] = types.MappingProxyType({
         "cache": Type.BOOL,
-    }
+    })
     """Options allowed to be set only from configuration file."""
 
     def __init__(self) -> None:  # noqa: PLR0915
         """Initialize the configuration to the default and load config files."""
-        self.hosts: dict[str, RpcUrl] = {}
-        """Hosts that can be used instead of URL."""
+        self.hosts: dict[str, str] = {}
+        """Hosts that can be used instead of URL.
+
+        URLs are parsed only when host is used.
+        """
         self.hosts_shell: dict[str, str] = {}
         """Hosts that can be used instead of URL but URL is generated using shell."""
-        self.path: pathlib.PurePosixPath = pathlib.PurePosixPath("/")
-        """Current path we are working relative to."""
+        self.__path = "/"
+        self.__ppath: pathlib.PurePosixPath | None = None
+        self.__shvpaths: dict[str, str] = {}
         self.__rurl: RpcUrl | None = None
         self.__url: RpcUrl | str | None = None
+        self.__debug = logging.root.level <= logging.DEBUG
 
         self.vimode: bool = False
         """CLI input in Vi mode."""
@@ -76,17 +116,16 @@ class CliConfig:
         self.initial_scan_depth: int = 3
         """Depth of the initial scan."""
 
-        config = configparser.ConfigParser()
-        config.read(["/etc/shvcli.ini", pathlib.Path.home() / ".shvcli.ini"])
+        config = _read_config(_CONFIG_FILES)
         for secname, sec in config.items():
             match secname:
                 case "DEFAULT":
                     for name, _ in sec.items():
                         raise ValueError(f"Invalid configuration: {secname}.{name}")
                 case "hosts":
-                    self.hosts.update({k: RpcUrl.parse(v) for k, v in sec.items()})
+                    self.hosts.update(sec.items())
                     if self.hosts and self.__url is None:
-                        self.__url = self.hosts[next(iter(self.hosts))]
+                        self.__url = _parse_rpcurl(self.hosts[next(iter(self.hosts))])
                 case "hosts-shell":
                     self.hosts_shell.update(sec.items())
                     if self.hosts_shell and self.__url is None:
@@ -120,14 +159,16 @@ class CliConfig:
             elif isinstance(self.__url, RpcUrl):
                 self.__rurl = self.__url
             elif isinstance(self.__url, str):
-                self.__rurl = RpcUrl.parse(
-                    subprocess.run(  # noqa S602
+                if set(self.__url).isdisjoint('$`\\"'):
+                    url = self.__url  # Shell would not expand anything
+                else:
+                    url = subprocess.run(  # noqa S602
                         f"printf '%s' \"{self.__url}\"",
                         shell=True,
                         stdout=subprocess.PIPE,
                         check=True,
                     ).stdout.decode()
-                )
+                self.__rurl = _parse_rpcurl(url)
             else:
                 raise NotImplementedError
         return self.__rurl
@@ -136,21 +177,35 @@ class CliConfig:
     def url(self, value: RpcUrl | str) -> None:
         if isinstance(value, str):
             if value in self.hosts:
-                value = self.hosts[value]
+                value = _parse_rpcurl(self.hosts[value])
             elif value in self.hosts_shell:
                 value = self.hosts_shell[value]
             else:
-                value = RpcUrl.parse(value)
+                value = _parse_rpcurl(value)
         self.__url = value
 
+    @property
+    def path(self) -> pathlib.PurePosixPath:
+        """Current path we are working relative to."""
+        if self.__ppath is None:
+            self.__ppath = pathlib.PurePosixPath(self.__path)
+        return self.__ppath
+
+    @path.setter
+    def path(self, value: pathlib.PurePosixPath) -> None:
+        self.__path = str(value)
+        self.__ppath = value
+        self.__shvpaths.clear()
+
     @property
     def debug(self) -> bool:
         """Log that provide debug output."""
-        return logging.root.level <= logging.DEBUG
+        return self.__debug
 
     @debug.setter
-    def debug(self, value: bool) -> None:  # noqa PLR6301
+    def debug(self, value: bool) -> None:
         logging.root.setLevel(logging.DEBUG if value else logging.WARNING)
+        self.__debug = value
 
     def shvpath(
         self,
@@ -159,18 +214,22 @@ class CliConfig:
         | typing.Iterable[str | pathlib.PurePosixPath] = "",
     ) -> str:
         """SVH path for given suffix."""
-        if not isinstance(suffix, str) and isinstance(suffix, collections.abc.Iterable):
-            suffix = functools.reduce(
-                lambda p, v: p / v, suffix, pathlib.PurePosixPath()
-            )
-            assert isinstance(suffix, pathlib.PurePosixPath)
-        return str(self.sanitpath(self.path / suffix))[1:]
+        if isinstance(suffix, str):
+            # Completion requests the same paths repeatedly and thus cache them
+            if (res := self.__shvpaths.get(suffix)) is None:
+                if len(self.__shvpaths) >= 64:
+                    self.__shvpaths.clear()
+                res = posixpath.normpath(posixpath.join(self.__path, suffix))[1:]
+                self.__shvpaths[suffix] = res
+            return res
+        if isinstance(suffix, pathlib.PurePosixPath):
+            suffix = (suffix,)
+        return posixpath.normpath(posixpath.join(self.__path, *map(str, suffix)))[1:]
 
     @staticmethod
     def sanitpath(path: pathlib.PurePosixPath) -> pathlib.PurePosixPath:
         """Remove '..' and '.' from path."""
-        return functools.reduce(
-            lambda p, v: p.parent if v == ".." else p if v == "." else p / v,
-            path.parts,
-            pathlib.PurePosixPath(),
-        )
+        if path.is_absolute():
+            return pathlib.PurePosixPath(posixpath.normpath(str(path)))
+        # Leading '..' can't be resolved in relative path and thus it is dropped
+        return pathlib.PurePosixPath(posixpath.normpath(f"/{path}")[1:])
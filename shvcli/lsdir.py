@@ -1,16 +1,38 @@
 """Special handling of ls and dir methods."""
 
+import asyncio
+import collections.abc
+import functools
 import itertools
 import pathlib
+import re
 import string
+import typing
 
-from shv import Cpon, RpcError, RpcMethodDesc, RpcMethodFlags
+from shv import Cpon, RpcError, RpcMethodDesc, RpcMethodFlags, SHVType
 
 from .client import Node, SHVClient
 from .config import CliConfig
 from .parse import CliItems
 from .tools import cpon_ftext, print_flist, print_row
 
+T = typing.TypeVar("T")
+
+_WHITESPACE = re.compile(f"[{re.escape(string.whitespace)}]")
+
+
+_NOT_CALLABLE = int(RpcMethodFlags.NOT_CALLABLE)
+_AUTOGET_MASK = int(RpcMethodFlags.GETTER | RpcMethodFlags.LARGE_RESULT_HINT)
+_GETTER = int(RpcMethodFlags.GETTER)
+
+_AUTOGET_CONCURRENCY = 8
+"""Maximum number of requests in flight for autoget of ls."""
+
+
+def _quote(name: str) -> str:
+    """Quote name if it contains any white space."""
+    return f'"{name}"' if _WHITESPACE.search(name) else name
+
 
 def ls_node_format(
     name: str, node: Node | None = None, parent_node: Node | None = None
@@ -18,51 +40,48 @@ def ls_node_format(
     """Print format for single node info."""
     nodestyle = "ansigray" if name.startswith(".") else ""
     if node is None and parent_node is not None:
-        node = parent_node.get(name, None)
+        node = parent_node.nodes.get(name, None)
     if node is not None:
         if "get" in node.methods:
             nodestyle = "ansiyellow"
         elif node.nodes:
             nodestyle = "ansiblue"
-    return (
-        nodestyle,
-        f'"{name}"' if any(c in name for c in string.whitespace) else name,
-    )
+    return nodestyle, _quote(name)
 
 
 def dir_method_format(method: RpcMethodDesc) -> tuple[str, str]:
     """Print format for single method info."""
-    methstyle = ""
-    if method.name in {"ls", "dir"}:
-        methstyle = "ansibrightblack"
-    elif RpcMethodFlags.SETTER in method.flags:
-        methstyle = "ansiyellow"
-    elif RpcMethodFlags.GETTER in method.flags:
-        if method.signals:
-            methstyle = "ansimagenta"
-        else:
-            methstyle = "ansigreen"
-    elif method.signals:
-        methstyle = "ansipurple"
-    name = method.name
-    return (
-        methstyle,
-        f'"{name}"' if any(c in name for c in string.whitespace) else name,
-    )
+    lsdir = method.name in {"ls", "dir"}
+    methstyle = _method_style(lsdir, method.flags, bool(method.signals))
+    return methstyle, _quote(method.name)
 
 
 def dir_signal_format(method: RpcMethodDesc, signal: str) -> tuple[str, str]:
     """Print format for signals."""
-    sigstyle = "ansipurple"
-    if method.name in {"ls", "dir"}:
-        sigstyle = "ansibrightblack"
-    elif RpcMethodFlags.GETTER in method.flags:
-        sigstyle = "ansimagenta"
-    label = f"{method.name}:{signal}"
-    return (
-        sigstyle,
-        f'"{label}"' if any(c in label for c in string.whitespace) else label,
-    )
+    sigstyle = _signal_style(method.name in {"ls", "dir"}, method.flags)
+    return sigstyle, _quote(f"{method.name}:{signal}")
+
+
+@functools.cache
+def _method_style(lsdir: bool, flags: RpcMethodFlags, signals: bool) -> str:
+    if lsdir:
+        return "ansibrightblack"
+    if RpcMethodFlags.SETTER in flags:
+        return "ansiyellow"
+    if RpcMethodFlags.GETTER in flags:
+        return "ansimagenta" if signals else "ansigreen"
+    if signals:
+        return "ansipurple"
+    return ""
+
+
+@functools.cache
+def _signal_style(lsdir: bool, flags: RpcMethodFlags) -> str:
+    if lsdir:
+        return "ansibrightblack"
+    if RpcMethodFlags.GETTER in flags:
+        return "ansimagenta"
+    return "ansipurple"
 
 
 async def ls_method(shvclient: SHVClient, config: CliConfig, items: CliItems) -> None:
@@ -72,74 +91,104 @@ async def ls_method(shvclient: SHVClient, config: CliConfig, items: CliItems) ->
     node = shvclient.tree.get_path(shvpath)
     assert node is not None
     if config.autoget:
-        for nn, nv in dict(node).items():
-            if not nv.methods_probed:
-                try:
-                    await shvclient.dir(str(pathlib.PurePosixPath(shvpath) / nn))
-                except RpcError:
-                    pass
-        if any("get" in nv.methods for nv in node.values()):
-            w = max(len(n) for n in node.keys())
-            for nn, nv in node.items():
-                n = [("", " " * (w - len(nn))), ls_node_format(nn, nv)]
-                if "get" in nv.methods:
-                    try:
-                        resp = await shvclient.call(
-                            str(pathlib.PurePosixPath(shvpath) / nn),
-                            "get",
-                            call_attempts=1,
-                            call_timeout=config.autoget_timeout,
+        base = pathlib.PurePosixPath(shvpath)
+        paths = {nn: str(base / nn) for nn in node.nodes}
+        limit = asyncio.Semaphore(_AUTOGET_CONCURRENCY)
+        await asyncio.gather(
+            *(
+                _limited(limit, _dir_probe(shvclient, paths[nn]))
+                for nn, nv in node.nodes.items()
+                if not nv.methods_probed
+            )
+        )
+        # Probes remove children that are not valid and thus snapshot only now
+        children = list(node.nodes.items())
+        has_get = ["get" in nv.methods for _, nv in children]
+        if any(has_get):
+            w = max(len(nn) for nn, _ in children)
+            resps = iter(
+                await asyncio.gather(
+                    *(
+                        _limited(
+                            limit,
+                            _autoget(
+                                shvclient,
+                                config,
+                                paths.get(nn) or str(base / nn),
+                                "get",
+                            ),
                         )
-                    except (RpcError, TimeoutError):
-                        pass
-                    else:
-                        print_row(
-                            itertools.chain(
-                                iter([*n, ("", "  ")]), cpon_ftext(Cpon.pack(resp))
-                            )
+                        for (nn, _), get in zip(children, has_get, strict=True)
+                        if get
+                    )
+                )
+            )
+            for (nn, nv), get in zip(children, has_get, strict=True):
+                n = [("", " " * (w - len(nn))), ls_node_format(nn, nv)]
+                if get and (resp := next(resps)) is not None:
+                    print_row(
+                        itertools.chain(
+                            iter([*n, ("", "  ")]), cpon_ftext(Cpon.pack(resp[0]))
                         )
-                        continue
-                print_row(n)
+                    )
+                else:
+                    print_row(n)
             return
-    print_flist(ls_node_format(nn, nv) for nn, nv in node.items())
+    print_flist(ls_node_format(nn, nv) for nn, nv in node.nodes.items())
 
 
 async def dir_method(shvclient: SHVClient, config: CliConfig, items: CliItems) -> None:
     """SHV dir method that is just smarter than regular call."""
     shvpath = items.interpret_param_path(config)
     dirr = await shvclient.dir(shvpath)
-    if config.autoget and any(_use_autoget(d) for d in dirr):
+    if config.autoget and any(autogets := [_use_autoget(d) for d in dirr]):
         w = max(len(d.name) for d in dirr)
-        for d in dirr:
-            if RpcMethodFlags.NOT_CALLABLE in d.flags:
+        for d, autoget in zip(dirr, autogets, strict=True):
+            if int(d.flags) & _NOT_CALLABLE:
                 continue  # Ignore not callable
             n = [("", " " * (w - len(d.name))), dir_method_format(d)]
-            if _use_autoget(d):
-                try:
-                    resp = await shvclient.call(
-                        shvpath,
-                        d.name,
-                        call_attempts=1,
-                        call_timeout=config.autoget_timeout,
-                    )
-                except (RpcError, TimeoutError):
-                    pass
-                else:
-                    print_row(
-                        itertools.chain(
-                            iter([*n, ("", "  ")]), cpon_ftext(Cpon.pack(resp))
-                        )
+            if autoget and (resp := await _autoget(shvclient, config, shvpath, d.name)):
+                print_row(
+                    itertools.chain(
+                        iter([*n, ("", "  ")]), cpon_ftext(Cpon.pack(resp[0]))
                     )
-                    continue
-            print_row(n)
+                )
+            else:
+                print_row(n)
     else:
         print_flist(dir_method_format(d) for d in dirr)
-    if any(d.signals for d in dirr):
-        print_flist(dir_signal_format(d, s) for d in dirr for s in d.signals)
+    if sigrows := [dir_signal_format(d, s) for d in dirr for s in d.signals]:
+        print_flist(sigrows)
 
 
 def _use_autoget(method: RpcMethodDesc) -> bool:
-    return (
-        RpcMethodFlags.GETTER in method.flags
-        and RpcMethodFlags.LARGE_RESULT_HINT not in method.flags
-    )
+    return int(method.flags) & _AUTOGET_MASK == _GETTER
+
+
+async def _limited(limit: asyncio.Semaphore, coro: collections.abc.Awaitable[T]) -> T:
+    async with limit:
+        return await coro
+
+
+async def _dir_probe(shvclient: SHVClient, path: str) -> None:
+    try:
+        await shvclient.dir(path)
+    except RpcError:
+        pass
+
+
+async def _autoget(
+    shvclient: SHVClient, config: CliConfig, path: str, method: str
+) -> tuple[SHVType] | None:
+    """Call getter for autoget and provide its result or ``None`` on failure."""
+    try:
+        return (
+            await shvclient.call(
+                path,
+                method,
+                call_attempts=1,
+                call_timeout=config.autoget_timeout,
+            ),
+        )
+    except (RpcError, TimeoutError):
+        return None
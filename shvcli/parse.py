@@ -2,6 +2,8 @@
 
 import dataclasses
 import enum
+import functools
+import typing
 
 from shv import SHVType
 from shv.cpon import Cpon
@@ -16,7 +18,14 @@ class CliFlags(enum.Flag):
     COMPLETE_CALL = enum.auto()
 
 
-@dataclasses.dataclass
+_NO_FLAGS = CliFlags(0)
+"""Default flags of :class:`CliItems`."""
+
+_UNPACKED: typing.Final = object()
+"""Placeholder for parameter that wasn't unpacked yet."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class CliItems:
     """Items parsed from CLI line."""
 
@@ -29,15 +38,22 @@ class CliItems:
     param_raw: str = ""
     """Raw parameter passed from CLI."""
 
-    flags: CliFlags = dataclasses.field(default_factory=lambda: CliFlags(0))
+    flags: CliFlags = _NO_FLAGS
     """Flags signaling the presence of some important dividers."""
 
+    _param: SHVType | object = dataclasses.field(
+        default=_UNPACKED, init=False, repr=False, compare=False
+    )
+
     @property
     def param(self) -> SHVType:
         """Parameter to be passed to the method."""
-        if not self.param_raw:
-            return None
-        return Cpon.unpack(self.param_raw)
+        if self._param is _UNPACKED:
+            param = Cpon.unpack(self.param_raw) if self.param_raw else None
+            # Dataclass is frozen and thus assignment has to bypass it
+            object.__setattr__(self, "_param", param)  # noqa: PLC2801
+            return param
+        return typing.cast(SHVType, self._param)
 
     def interpret_param_path(self, config: CliConfig) -> str:
         """Interpret parameter as path specification.
@@ -53,27 +69,36 @@ class CliItems:
 
         :return: SHV RPC RI.
         """
+        prefix = f"{self.path}/" if self.path else ""
         res = []
         for item in self.param_raw.split():
-            parts = item.split(":")
-            path = parts[0] if parts[0] else "**"
-            method = parts[1] if len(parts) == 2 else "*"
-            signal = parts[2] if len(parts) == 3 else "*"
-            res.append(f"{self.path}{'/' if self.path else ''}{path}:{method}:{signal}")
+            path, colon, method = item.partition(":")
+            method, sep, signal = method.partition(":")
+            if not colon or (sep and not method):
+                method = "*"
+            if not sep:
+                signal = "*"
+            res.append(f"{prefix}{path or '**'}:{method}:{signal}")
         return res
 
 
 def parse_line(line: str) -> CliItems:
     """Parse CLI line."""
-    res = CliItems()
-    if " " in line:
-        res.flags |= CliFlags.COMPLETE_CALL
-        line, res.param_raw = line.split(" ", maxsplit=1)
-    if ":" in line:
-        res.flags |= CliFlags.HAS_COLON
-        res.path, res.method = line.split(":", maxsplit=1)
-    elif "/" in line:
-        res.path = line
-    else:
-        res.method = line
-    return res
+    head, sep, param_raw = line.partition(" ")
+    flags = CliFlags.COMPLETE_CALL if sep else _NO_FLAGS
+    path, colon, method = head.partition(":")
+    if colon:
+        flags |= CliFlags.HAS_COLON
+    elif "/" not in head:
+        path, method = "", head
+    return CliItems(path, method, param_raw, flags)
+
+
+@functools.lru_cache(maxsize=8)
+def parse_line_cached(line: str) -> CliItems:
+    """Parse CLI line same as :func:`parse_line` but reuse recent results.
+
+    Completion and validation parse the same line on every key press and
+    thus the returned items are shared.
+    """
+    return parse_line(line)
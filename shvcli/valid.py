@@ -6,7 +6,7 @@ from prompt_toolkit.validation import ValidationError, Validator
 from . import builtin
 from .client import SHVClient
 from .config import CliConfig
-from .parse import CliFlags, parse_line
+from .parse import CliFlags, parse_line_cached
 
 
 class CliValidator(Validator):
@@ -19,13 +19,13 @@ class CliValidator(Validator):
 
     def validate(self, document: Document) -> None:
         """Perform validation."""
-        items = parse_line(document.text)
+        items = parse_line_cached(document.text)
 
         # Parameters
         if CliFlags.COMPLETE_CALL in items.flags:
             if items.method in {"ls", "dir"} and not self.config.raw:
                 return
-            if builtin.get_builtin(items.method[1:]):
+            if items.method.startswith("!") and builtin.get_builtin(items.method[1:]):
                 # TODO we can add validation to the builtins as well
                 return
             # Any other command should have CPON as argument and thus validate